@@ -1,7 +1,7 @@
 """Recipe Unit Converter - Convert between recipe measurement units."""
 
 from .converter import Converter
-from .repository import Repository
+from .repository import Repository, get_default_repository
 from .parser import Parser
 from .models import (
     ParsedQuery,
@@ -24,6 +24,7 @@ __all__ = [
     "Converter",
     "Repository",
     "Parser",
+    "get_default_repository",
     # Models
     "ParsedQuery",
     "ConversionResult",
@@ -1,6 +1,7 @@
 import sys
 import argparse
 import json
+from typing import List, Optional
 
 from .converter import Converter
 from .models import ConversionResult
@@ -44,8 +45,16 @@ def format_output(result: ConversionResult, format_type: str) -> str:
         raise ValueError(f"Unknown format type: {format_type}")
 
 
-def main() -> None:
-    """Main CLI entry point."""
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Main CLI entry point.
+
+    Args:
+        argv: Command-line arguments, excluding the program name. Defaults to sys.argv[1:].
+
+    Returns:
+        Process exit code: 0 on success, 1 on error
+    """
     parser = argparse.ArgumentParser(
         description="Convert between recipe measurement units",
         epilog="Example: recipe-convert '2 cups flour' --to grams"
@@ -67,7 +76,7 @@ def main() -> None:
         help="Output format (default: simple)"
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     try:
         # Initialize converter (auto-loads bundled data)
@@ -79,15 +88,15 @@ def main() -> None:
         # Format and print output
         output = format_output(result, args.format)
         print(output)
-        sys.exit(0)
+        return 0
 
     except ConverterError as e:
         print(f"Error: {e}", file=sys.stderr)
-        sys.exit(1)
+        return 1
     except Exception as e:
         print(f"Unexpected error: {e}", file=sys.stderr)
-        sys.exit(1)
+        return 1
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
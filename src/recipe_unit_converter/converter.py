@@ -1,134 +1,197 @@
-from typing import Optional
-from pathlib import Path
-
-try:
-    from importlib.resources import files
-except ImportError:
-    from importlib_resources import files  # type: ignore
+from typing import Callable, Dict, List, Optional, Tuple
 
 from .models import ConversionResult, ParsedQuery
-from .repository import Repository
+from .repository import Repository, get_default_repository
 from .parser import Parser
 from .exceptions import InvalidConversionError
 
 
+# Affine temperature conversions keyed on canonical (from, to) unit keys
+_TEMP_FUNCS: Dict[Tuple[str, str], Callable[[float], float]] = {
+    ('c', 'c'): lambda v: v,
+    ('c', 'f'): lambda v: (v * 9/5) + 32,
+    ('c', 'k'): lambda v: v + 273.15,
+    ('f', 'c'): lambda v: (v - 32) * 5/9,
+    ('f', 'f'): lambda v: v,
+    ('f', 'k'): lambda v: (v - 32) * 5/9 + 273.15,
+    ('k', 'c'): lambda v: v - 273.15,
+    ('k', 'f'): lambda v: ((v - 273.15) * 9/5) + 32,
+    ('k', 'k'): lambda v: v,
+}
+
+
 class Converter:
     def __init__(self, repository: Optional[Repository] = None) -> None:
         """
         Initialize the converter.
 
         Args:
-            repository: Optional custom Repository. If None, uses bundled data.
+            repository: Optional custom Repository. If None, uses the shared
+                bundled-data Repository from get_default_repository().
         """
         if repository is None:
-            # Auto-load bundled data
-            data_path = Path(str(files('recipe_unit_converter') / 'data'))
-            self.repo: Repository = Repository(data_path)
+            # Bundled data, loaded once per process
+            self.repo: Repository = get_default_repository()
         else:
             self.repo = repository
         self.parser: Parser = Parser()
 
 
     def _convert_temp(self, value: float, from_unit: str, to_unit: str) -> float:
-        """Affine temperature conversion."""
-        # Normalize to Celsius
-        c_val: float
-        if from_unit == 'f':
-            c_val = (value - 32) * 5/9
-        elif from_unit == 'k':
-            c_val = value - 273.15
-        else:
-            c_val = value  # assumed c
-
-        # Convert to Target
-        if to_unit == 'f':
-            return (c_val * 9/5) + 32
-        elif to_unit == 'k':
-            return c_val + 273.15
-        else:
-            return c_val
-
+        """Affine temperature conversion between canonical unit keys."""
+        temp_func: Optional[Callable[[float], float]] = _TEMP_FUNCS.get((from_unit, to_unit))
+        if temp_func is None:
+            raise InvalidConversionError(
+                f"Unsupported temperature conversion from '{from_unit}' to '{to_unit}'."
+            )
+        return temp_func(value)
+
+
+    def _convert_quantities(
+        self,
+        quantities: List[float],
+        source_unit: str,
+        target_unit: str,
+        ingredient_name: Optional[str],
+    ) -> Tuple[List[float], str, Optional[str]]:
+        """
+        Convert quantities that share a source unit and ingredient.
 
-    def convert(self, query_text: str, target_unit: str) -> ConversionResult:
-        # 1. Parse
-        parsed: ParsedQuery = self.parser.parse(query_text)
+        Unit, ingredient and density lookups happen once; only the arithmetic
+        runs per quantity.
 
-        target_unit = target_unit.lower()
-        source_unit: str = parsed.unit
+        Returns:
+            Unrounded converted values, the explanation, and the matched
+            ingredient name (None unless a density was used)
+        """
+        # Identical units: validate once, skip all routing and arithmetic
+        if source_unit == target_unit:
+            self.repo.get_unit_type(source_unit)
+            return list(quantities), "Source and target units are identical; no conversion applied.", None
 
-        # 2. Validate Types
+        # Validate Types
         source_type: str = self.repo.get_unit_type(source_unit)
         target_type: str = self.repo.get_unit_type(target_unit)
 
-        final_value: float = 0.0
+        values: List[float] = []
         explanation: str = ""
         ingredient: Optional[str] = None
 
-        # 3. Route Logic
-        
+        # Route Logic
+
         # --- Scenario 1: Temperature ---
         if source_type == 'temperature' or target_type == 'temperature':
             if source_type != target_type:
                 raise InvalidConversionError("Cannot convert between Temperature and other categories.")
-            
-            final_value = self._convert_temp(parsed.quantity, source_unit, target_unit)
+
+            from_key: str = self.repo.get_canonical_unit(source_unit)
+            to_key: str = self.repo.get_canonical_unit(target_unit)
+            values = [self._convert_temp(qty, from_key, to_key) for qty in quantities]
             explanation = f"Temperature converted from {source_unit.upper()} to {target_unit.upper()}."
 
         # --- Scenario 2: Same Category (Linear) ---
         elif source_type == target_type:
-            source_factor: float = self.repo.get_factor(source_unit)
-            target_factor: float = self.repo.get_factor(target_unit)
+            scale: float = self.repo.get_factor(source_unit) * self.repo.get_inv_factor(target_unit)
 
-            base_qty: float = parsed.quantity * source_factor
-            final_value = base_qty / target_factor
+            values = [qty * scale for qty in quantities]
             explanation = f"Direct conversion ({source_type})."
 
         # --- Scenario 3: Cross Category (Density Required) ---
         else:
-            if parsed.ingredient is None:
+            if ingredient_name is None:
                 raise InvalidConversionError(
                     "Ingredient must be specified for conversions between volume and weight."
                 )
             # Need an ingredient
-            ingredient_entry = self.repo.match_ingredient(parsed.ingredient)
+            ingredient_entry = self.repo.match_ingredient(ingredient_name)
             if ingredient_entry.density is None:
                 raise InvalidConversionError(
                     f"No density data available for ingredient '{ingredient_entry.names[0]}'."
                 )
             density: float = ingredient_entry.density  # g/ml
 
-            # Convert Source to Base (ml or g)
-            source_factor = self.repo.get_factor(source_unit)
-            base_source_qty: float = parsed.quantity * source_factor
-
-            base_target_qty: float = 0.0
+            # Source -> base (ml or g) and base target -> final unit
+            unit_scale: float = self.repo.get_factor(source_unit) * self.repo.get_inv_factor(target_unit)
 
             # Vol -> Weight (Mass = Vol * Density)
             if source_type == 'volume' and target_type == 'weight':
-                # base_source_qty is ml
-                # result is g
-                base_target_qty = base_source_qty * density
+                scale = unit_scale * density
+                values = [qty * scale for qty in quantities]
                 explanation = f"Volume to Weight using density of {ingredient_entry.names[0]} ({density} g/ml)."
 
             # Weight -> Vol (Vol = Mass / Density)
             elif source_type == 'weight' and target_type == 'volume':
-                # base_source_qty is g
-                # result is ml
-                base_target_qty = base_source_qty / density
+                scale = unit_scale / density
+                values = [qty * scale for qty in quantities]
                 explanation = f"Weight to Volume using density of {ingredient_entry.names[0]} ({density} g/ml)."
-            
+
             ingredient = ingredient_entry.names[0]
 
-            # Convert Base Target -> Final Unit
-            target_factor = self.repo.get_factor(target_unit)
-            final_value = base_target_qty / target_factor
+        return values, explanation, ingredient
+
+
+    def convert(self, query_text: str, target_unit: str) -> ConversionResult:
+        # 1. Parse
+        parsed: ParsedQuery = self.parser.parse(query_text)
+
+        target_unit = target_unit.lower()
+        source_unit: str = parsed.unit
+
+        # 2. Validate and convert
+        values, explanation, ingredient = self._convert_quantities(
+            [parsed.quantity], source_unit, target_unit, parsed.ingredient
+        )
 
         return ConversionResult(
             original_query=query_text,
             source_unit=source_unit,
             target_unit=target_unit,
-            result_value=round(final_value, 4),
+            result_value=round(values[0], 4),
             result_unit=target_unit,
             ingredient=ingredient,
             explanation=explanation
         )
+
+
+    def convert_batch(self, queries: List[str], target_unit: str) -> List[ConversionResult]:
+        """
+        Convert several queries (e.g. a whole ingredient list) to one target unit.
+
+        Queries are grouped by source unit and ingredient, so unit, ingredient
+        and density lookups run once per group instead of once per query.
+
+        Args:
+            queries: Recipe queries (e.g., ["2 cups flour", "1 cup sugar"])
+            target_unit: Unit every query is converted to
+
+        Returns:
+            One ConversionResult per query, in input order
+
+        Raises:
+            ConverterError: Same errors as `convert`; one failing query fails the batch
+        """
+        parsed_queries: List[ParsedQuery] = [self.parser.parse(q) for q in queries]
+        target_unit = target_unit.lower()
+
+        # Bucket query indices by everything that affects the conversion
+        groups: Dict[Tuple[str, Optional[str]], List[int]] = {}
+        for index, parsed in enumerate(parsed_queries):
+            groups.setdefault((parsed.unit, parsed.ingredient), []).append(index)
+
+        results: Dict[int, ConversionResult] = {}
+        for (source_unit, ingredient_name), indices in groups.items():
+            values, explanation, ingredient = self._convert_quantities(
+                [parsed_queries[i].quantity for i in indices], source_unit, target_unit, ingredient_name
+            )
+            for index, value in zip(indices, values):
+                results[index] = ConversionResult(
+                    original_query=queries[index],
+                    source_unit=source_unit,
+                    target_unit=target_unit,
+                    result_value=round(value, 4),
+                    result_unit=target_unit,
+                    ingredient=ingredient,
+                    explanation=explanation
+                )
+
+        return [results[index] for index in range(len(queries))]
@@ -1,52 +1,67 @@
+from dataclasses import dataclass
 from typing import List, Optional, Dict
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 # --- Data Loading Models ---
 
-class UnitDetail(BaseModel):
+class _FrozenModel(BaseModel):
+    # Loaded once and shared by every lookup; Pydantic has no __slots__ option
+    model_config = ConfigDict(frozen=True)
+
+
+class UnitDetail(_FrozenModel):
     factor: float
     aliases: List[str]
 
 
-class TemperatureUnitDetail(BaseModel):
+class TemperatureUnitDetail(_FrozenModel):
     aliases: List[str]
 
 
-class VolumeDefinition(BaseModel):
+class VolumeDefinition(_FrozenModel):
     base: str
     units: Dict[str, UnitDetail]
 
 
-class WeightDefinition(BaseModel):
+class WeightDefinition(_FrozenModel):
     base: str
     units: Dict[str, UnitDetail]
 
 
-class TempDefinition(BaseModel):
+class TempDefinition(_FrozenModel):
     units: Dict[str, TemperatureUnitDetail]
 
 
-class UnitsDb(BaseModel):
+class UnitsDb(_FrozenModel):
     volume: VolumeDefinition
     weight: WeightDefinition
     temperature: TempDefinition
 
 
-class IngredientEntry(BaseModel):
+# Plain dataclass: validated when loaded through IngredientsDb, cheap to build otherwise
+@dataclass(slots=True, frozen=True)
+class IngredientEntry:
     id: str
     names: List[str]
     density: Optional[float] = None
     source: Optional[List[Dict[str, str]]] = None
 
+
+class IngredientsDb(_FrozenModel):
+    ingredients: List[IngredientEntry]
+
 # --- Application Models ---
+# Built on every parse/convert from already-trusted values, so no validation
 
-class ParsedQuery(BaseModel):
+@dataclass(slots=True, frozen=True)
+class ParsedQuery:
     quantity: float
     unit: str
     ingredient: Optional[str] = None
 
 
-class ConversionResult(BaseModel):
+@dataclass(slots=True, frozen=True)
+class ConversionResult:
     original_query: str
     source_unit: str
     target_unit: str
@@ -1,69 +1,201 @@
 import re
-from fractions import Fraction
-from typing import Optional
+import string
+import functools
+from typing import Dict, Optional, Tuple
 from .models import ParsedQuery
 from .exceptions import ParsingError
 
+# Patterns are compiled once at import and read as module globals on the hot path
+
+# Regex for numeric quantities (integers, decimals, fractions, mixed fractions)
+# Matches: "2", "1.5", "1/4", "1 1/2"
+_NUMERIC_RE = re.compile(
+    r"^(?:(\d+)\s+)?(\d+)/(\d+)|(\d+(?:\.\d+)?)", re.ASCII
+)
+
+# Main pattern for query: quantity + unit + optional "of" + optional ingredient
+_QUERY_RE = re.compile(
+    r"^(.+?)\s+([a-zA-Z°_]+)\s*(?:of)?\s*(?:of\s+)?(.*)?$"
+)
+
+# Word-to-number mapping for natural language quantities
+_WORD_NUMBERS: Dict[str, float] = {
+    "zero": 0.0, "a": 1.0, "an": 1.0,
+    "one": 1.0, "two": 2.0, "three": 3.0, "four": 4.0, "five": 5.0,
+    "six": 6.0, "seven": 7.0, "eight": 8.0, "nine": 9.0, "ten": 10.0,
+    "eleven": 11.0, "twelve": 12.0, "thirteen": 13.0, "fourteen": 14.0, "fifteen": 15.0,
+    "sixteen": 16.0, "seventeen": 17.0, "eighteen": 18.0, "nineteen": 19.0, "twenty": 20.0,
+    "thirty": 30.0, "forty": 40.0, "fifty": 50.0, "sixty": 60.0,
+    "seventy": 70.0, "eighty": 80.0, "ninety": 90.0,
+    "quarter": 0.25, "half": 0.5,
+}
+
+# Fractions that dominate recipes; values equal n / d exactly, so lookups and
+# divisions agree
+_COMMON_FRACS: Dict[Tuple[int, int], float] = {
+    (1, 2): 1 / 2, (1, 3): 1 / 3, (2, 3): 2 / 3, (1, 4): 1 / 4, (3, 4): 3 / 4,
+    (1, 8): 1 / 8, (3, 8): 3 / 8, (5, 8): 5 / 8, (7, 8): 7 / 8, (1, 16): 1 / 16,
+}
+
+# Character classes for the quantity scanner (ASCII, like _NUMERIC_RE)
+_DIGITS = frozenset(string.digits)
+_SPACES = frozenset(" \t\n\r\f\v")
+
+# Characters allowed in a unit token (same set as _QUERY_RE's unit group)
+_UNIT_CHARS = frozenset(string.ascii_letters + "°_")
+
 
 class Parser:
-    # Word-to-number mapping for natural language quantities
-    WORD_NUMBERS = {
-        "one": 1, "two": 2, "three": 3, "four": 4, "five": 5,
-        "six": 6, "seven": 7, "eight": 8, "nine": 9, "ten": 10,
-        "eleven": 11, "twelve": 12, "thirteen": 13, "fourteen": 14, "fifteen": 15,
-        "sixteen": 16, "seventeen": 17, "eighteen": 18, "nineteen": 19, "twenty": 20,
-        "quarter": 0.25, "half": 0.5
-    }
-
-    # Regex for numeric quantities (integers, decimals, fractions, mixed fractions)
-    # Matches: "2", "1.5", "1/4", "1 1/2"
-    NUMERIC_PATTERN = re.compile(
-        r"^(?:(\d+)\s+)?(\d+)/(\d+)|(\d+(?:\.\d+)?)"
-    )
-
-    # Main pattern for query: quantity + unit + optional "of" + optional ingredient
-    PATTERN = re.compile(
-        r"^(.+?)\s+([a-zA-Z°_]+)\s*(?:of)?\s*(?:of\s+)?(.*)?$"
-    )
+    # Class-level aliases of the module patterns, kept for existing callers
+    WORD_NUMBERS = _WORD_NUMBERS
+    NUMERIC_PATTERN = _NUMERIC_RE
+    PATTERN = _QUERY_RE
+    UNIT_CHARS = _UNIT_CHARS
+
+    @staticmethod
+    def _scan(text: str) -> Optional[Tuple[str, str, str]]:
+        """
+        Split a stripped query into (quantity, unit, rest) in one left-to-right pass.
+
+        Equivalent to _QUERY_RE without regex backtracking: the quantity ends at
+        the first whitespace run followed by a unit character, the unit is the
+        longest run of unit characters, and leading "of" tokens are skipped.
+        Returns None if the query has no unit.
+        """
+        if "\n" in text:
+            # PATTERN's '.' does not cross newlines; let the regex decide
+            match = _QUERY_RE.match(text)
+            if not match:
+                return None
+            qty_str, unit_str, rest = match.groups()
+            return qty_str, unit_str, rest or ""
+
+        n = len(text)
+        unit_chars = _UNIT_CHARS
+
+        # Quantity: up to the first whitespace run that precedes a unit character
+        i = 1
+        unit_start = -1
+        while i < n:
+            if text[i].isspace():
+                j = i + 1
+                while j < n and text[j].isspace():
+                    j += 1
+                if j < n and text[j] in unit_chars:
+                    unit_start = j
+                    break
+                i = j
+            else:
+                i += 1
+        if unit_start < 0:
+            return None
+
+        # Unit: longest run of unit characters
+        pos = unit_start
+        while pos < n and text[pos] in unit_chars:
+            pos += 1
+        unit_end = pos
+
+        # Rest: skip whitespace, an optional "of", whitespace, an optional "of "
+        while pos < n and text[pos].isspace():
+            pos += 1
+        if text.startswith("of", pos):
+            pos += 2
+        while pos < n and text[pos].isspace():
+            pos += 1
+        if text.startswith("of", pos) and pos + 2 < n and text[pos + 2].isspace():
+            pos += 3
+            while pos < n and text[pos].isspace():
+                pos += 1
+
+        return text[:i], text[unit_start:unit_end], text[pos:]
+
+    @staticmethod
+    def _fraction(text: str, numerator: str, denominator: str) -> float:
+        """Evaluate a digit-string fraction, using the common-fractions table first."""
+        num, den = int(numerator), int(denominator)
+        if den == 0:
+            raise ParsingError(f"Invalid quantity '{text}': denominator is zero")
+        return _COMMON_FRACS.get((num, den), num / den)
+
+    @staticmethod
+    def _scan_quantity(text: str) -> Optional[float]:
+        """
+        Read a leading number from `text` in one left-to-right pass.
+
+        Equivalent to a prefix match of _NUMERIC_RE: a mixed fraction
+        ("1 1/2"), a simple fraction ("1/4"), or an integer/decimal ("2", "1.5").
+        Trailing characters are ignored. Returns None if `text` does not start
+        with a digit; raises ParsingError for a zero denominator.
+        """
+        n = len(text)
+        digits = _DIGITS
+
+        end = 0
+        while end < n and text[end] in digits:
+            end += 1
+        if end == 0:
+            return None
+        lead = text[:end]
+
+        # Mixed fraction: digits, whitespace, digits "/" digits
+        pos = end
+        while pos < n and text[pos] in _SPACES:
+            pos += 1
+        if pos > end:
+            slash = pos
+            while slash < n and text[slash] in digits:
+                slash += 1
+            if slash > pos and slash < n and text[slash] == "/":
+                stop = slash + 1
+                while stop < n and text[stop] in digits:
+                    stop += 1
+                if stop > slash + 1:
+                    return int(lead) + Parser._fraction(text, text[pos:slash], text[slash + 1:stop])
+
+        # Simple fraction: digits "/" digits
+        if end < n and text[end] == "/":
+            stop = end + 1
+            while stop < n and text[stop] in digits:
+                stop += 1
+            if stop > end + 1:
+                return Parser._fraction(text, lead, text[end + 1:stop])
+
+        # Decimal or integer
+        if end + 1 < n and text[end] == "." and text[end + 1] in digits:
+            stop = end + 2
+            while stop < n and text[stop] in digits:
+                stop += 1
+            return float(text[:stop])
+        return float(lead)
 
     @staticmethod
+    @functools.lru_cache(maxsize=128)
     def _parse_quantity(qty_str: str) -> float:
         """
         Parse quantity string into float.
         Supports: integers, decimals, fractions (1/4), mixed fractions (1 1/2),
-        word numbers (one-twenty, quarter, half).
+        word numbers (zero-twenty, tens up to ninety, a/an, quarter, half).
+        Expects a stripped, lowercased string (normalized once by `parse`).
+        Results are memoized; invalid quantities raise and are not cached.
         """
-        qty_str = qty_str.strip().lower()
-
         # Handle special case: "half a" → 0.5
         if qty_str == "half a":
             return 0.5
 
         # Try word number first
-        if qty_str in Parser.WORD_NUMBERS:
-            return float(Parser.WORD_NUMBERS[qty_str])
+        word_value = _WORD_NUMBERS.get(qty_str)
+        if word_value is not None:
+            return word_value
 
-        # Try numeric parsing
-        match = Parser.NUMERIC_PATTERN.match(qty_str)
-        if not match:
+        # Try numeric parsing: "2", "1.5", "1/4", "1 1/2"
+        quantity = Parser._scan_quantity(qty_str)
+        if quantity is None:
             raise ParsingError(
                 f"Invalid quantity: '{qty_str}'. "
                 f"Expected format: number (e.g., 2, 1.5, 1/4, 1 1/2)"
             )
-
-        whole_part, numerator, denominator, decimal_num = match.groups()
-
-        # Mixed fraction: "1 1/2"
-        if numerator and denominator:
-            whole = int(whole_part) if whole_part else 0
-            frac = Fraction(int(numerator), int(denominator))
-            return float(whole + frac)
-
-        # Simple decimal or integer: "2" or "1.5"
-        if decimal_num:
-            return float(decimal_num)
-
-        raise ParsingError(f"Could not parse quantity: '{qty_str}'")
+        return quantity
 
     @staticmethod
     def parse(query_text: str) -> ParsedQuery:
@@ -76,19 +208,60 @@ class Parser:
             "half a cup sugar" → ParsedQuery(quantity=0.5, unit="cup", ingredient="sugar")
         """
         cleaned = query_text.strip()
-        match = Parser.PATTERN.match(cleaned)
-
-        if not match:
+        parsed = Parser._parse_simple(cleaned)
+        if parsed is None:
+            parsed = Parser._parse_stripped(cleaned)
+        if parsed is None:
             raise ParsingError(
                 f"Could not parse query: '{query_text}'. "
                 f"Expected format: '<number> <unit> [ingredient]' (e.g., '2 cups flour')"
             )
+        return parsed
+
+    @staticmethod
+    def _parse_simple(cleaned: str) -> Optional[ParsedQuery]:
+        """
+        Fast path for the dominant shapes "<int> <unit>" and "<int> <unit> <word>".
+
+        Only handles single-space-separated ASCII input whose result is
+        certain to equal the full parse; returns None for anything else.
+        """
+        parts = cleaned.split()
+        if len(parts) == 2:
+            head, unit = parts
+            ingredient = None
+        elif len(parts) == 3:
+            head, unit, ingredient = parts
+            # "of" is consumed as a prefix by the full scanner, even in "offal"
+            if ingredient.startswith("of"):
+                return None
+        else:
+            return None
+        if not (head.isascii() and head.isdigit() and unit.isascii() and unit.isalpha()):
+            return None
+        if " ".join(parts) != cleaned:
+            # Tabs, newlines or repeated spaces: let the scanner decide
+            return None
+        return ParsedQuery(quantity=float(head), unit=unit.lower(), ingredient=ingredient)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _parse_stripped(cleaned: str) -> Optional[ParsedQuery]:
+        """
+        Parse a stripped query; memoized because recipe queries repeat heavily.
+
+        Only surrounding whitespace is normalized, so the cached result is
+        identical to parsing the raw text. Returns None if the query has no unit.
+        """
+        scanned = Parser._scan(cleaned)
+        if scanned is None:
+            return None
 
-        qty_str, unit_str, ingredient_str = match.groups()
+        qty_str, unit_str, ingredient_str = scanned
 
         # Parse quantity (supports fractions, decimals, word numbers)
         try:
-            quantity = Parser._parse_quantity(qty_str)
+            quantity = Parser._parse_quantity(qty_str.lower())
         except ParsingError:
             raise
         except Exception as e:
@@ -1,126 +1,155 @@
-import json
+import sys
 import logging
 import difflib
+import functools
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import Any, List, Dict, Callable, Iterator, NamedTuple, Optional, Tuple
 
-from .models import UnitsDb, IngredientEntry
+try:
+    from importlib.resources import files
+except ImportError:
+    from importlib_resources import files  # type: ignore
+
+from .models import UnitsDb, UnitDetail, TemperatureUnitDetail, IngredientEntry, IngredientsDb
 from .exceptions import UnitNotFoundError, IngredientNotFoundError, IngredientAmbiguousError
 
 logger = logging.getLogger(__name__)
 
+# Minimum difflib ratio for a fuzzy ingredient match; also bounds candidate pruning
+_FUZZY_CUTOFF = 0.6
+
+
+class AliasInfo(NamedTuple):
+    """Everything a unit lookup needs, stored once per lowercased alias."""
+    unit_type: str
+    canonical: str
+    factor: Optional[float]
+    inv_factor: Optional[float]
+
 
 class Repository:
+    data_dir: Optional[Path]
+    units_db: UnitsDb
+    ingredients: List[IngredientEntry]
+    _alias_map: Dict[str, IngredientEntry]
+    _all_ingredient_names: Tuple[str, ...]
+    _names_by_len: Dict[int, List[str]]
+    _alias_index: Dict[str, AliasInfo]
+    _lookup_ingredient_names: Callable[[str], Tuple[str, ...]]
+
     def __init__(self, data_dir: Path) -> None:
-        self.data_dir: Path = data_dir
-        self.units_db: UnitsDb
-        self.ingredients: List[IngredientEntry]
-        self._alias_map: Dict[str, IngredientEntry]
-        self._unit_alias_map: Dict[str, str]
+        self.data_dir = data_dir
+        self._load_data(data_dir)
+        self._setup()
+
+    @classmethod
+    def from_dict(cls, units: Dict[str, Any], ingredients: Dict[str, Any]) -> "Repository":
+        """
+        Build a repository from already-decoded data instead of JSON files.
 
-        self._load_data()
+        Args:
+            units: Data in the shape of units.json
+            ingredients: Data in the shape of ingredients.json
+
+        Returns:
+            A Repository with no backing data directory
+        """
+        repo = cls.__new__(cls)
+        repo.data_dir = None
+        repo.units_db = UnitsDb.model_validate(units)
+        repo.ingredients = IngredientsDb.model_validate(ingredients).ingredients
+        repo._setup()
+        return repo
+
+    def _setup(self) -> None:
+        """Build lookup indexes and the per-instance fuzzy-match cache from the loaded data."""
+        self._build_ingredient_index()
         self._build_unit_alias_map()
 
+        # Memoized per instance so repeated ingredient strings skip difflib
+        self._lookup_ingredient_names = functools.lru_cache(maxsize=1024)(self._find_ingredient_names)
 
-    def _load_data(self) -> None:
+    def _load_data(self, data_dir: Path) -> None:
         # Load Units
         try:
-            with open(self.data_dir / "units.json", "r") as f:
-                raw_data: Any = json.load(f)
-                self.units_db = UnitsDb(**raw_data)
+            with open(data_dir / "units.json", "rb") as f:
+                self.units_db = UnitsDb.model_validate_json(f.read())
         except FileNotFoundError:
             logger.error("units.json not found")
             raise
 
         # Load Ingredients
         try:
-            with open(self.data_dir / "ingredients.json", "r") as f:
-                raw_data = json.load(f)
-                self.ingredients = [IngredientEntry(**i) for i in raw_data["ingredients"]]
+            with open(data_dir / "ingredients.json", "rb") as f:
+                self.ingredients = IngredientsDb.model_validate_json(f.read()).ingredients
         except FileNotFoundError:
             logger.error("ingredients.json not found")
             raise
 
-        # Build O(1) Alias Map
-        self._alias_map = {}
+    def _build_ingredient_index(self) -> None:
+        # Build O(1) Alias Map with keys lowercased once here, not per query
+        alias_map: Dict[str, IngredientEntry] = {}
         for ing in self.ingredients:
-            for name in ing.names:
-                self._alias_map[name.lower()] = ing
-
-    def _build_unit_alias_map(self) -> None:
-        """Build a master lookup index mapping all unit aliases to their canonical keys."""
-        self._unit_alias_map = {}
-
-        # Process volume units
-        for canonical_key, unit_detail in self.units_db.volume.units.items():
-            # Add canonical key pointing to itself
-            normalized_key: str = canonical_key.lower().strip()
-            self._unit_alias_map[normalized_key] = canonical_key
-
-            # Add all aliases pointing to canonical key
-            for alias in unit_detail.aliases:
-                normalized_alias: str = alias.lower().strip()
-                if normalized_alias in self._unit_alias_map:
-                    collision_key: str = self._unit_alias_map[normalized_alias]
-                    logger.warning(
-                        f"Alias collision: '{normalized_alias}' already mapped to '{collision_key}' "
-                        f"(volume), now also found in volume unit '{canonical_key}'. "
-                        f"Using first occurrence."
-                    )
-                else:
-                    self._unit_alias_map[normalized_alias] = canonical_key
-        
-        # Process weight units
-        for canonical_key, unit_detail in self.units_db.weight.units.items():
-            # Add canonical key pointing to itself
-            normalized_key = canonical_key.lower().strip()
-            if normalized_key in self._unit_alias_map:
-                collision_key = self._unit_alias_map[normalized_key]
-                logger.warning(
-                    f"Alias collision: '{normalized_key}' already mapped to '{collision_key}' "
-                    f"(volume), now also found in weight unit '{canonical_key}'. "
-                    f"Using first occurrence."
-                )
-            else:
-                self._unit_alias_map[normalized_key] = canonical_key
-
-            # Add all aliases pointing to canonical key
-            for alias in unit_detail.aliases:
-                normalized_alias = alias.lower().strip()
-                if normalized_alias in self._unit_alias_map:
-                    collision_key = self._unit_alias_map[normalized_alias]
+            for name in dict.fromkeys(name.lower().strip() for name in ing.names):
+                existing: IngredientEntry | None = alias_map.get(name)
+                if existing is None:
+                    alias_map[sys.intern(name)] = ing
+                elif existing.id != ing.id:
                     logger.warning(
-                        f"Alias collision: '{normalized_alias}' already mapped to '{collision_key}', "
-                        f"now also found in weight unit '{canonical_key}'. "
-                        f"Using first occurrence."
+                        "Ingredient name collision: '%s' already mapped to '%s', now also found in '%s'. "
+                        "Using first occurrence.",
+                        name, existing.id, ing.id
                     )
-                else:
-                    self._unit_alias_map[normalized_alias] = canonical_key
-        
-        # Process temperature units
-        for canonical_key, temp_unit_detail in self.units_db.temperature.units.items():
-            normalized_key = canonical_key.lower().strip()
-            if normalized_key in self._unit_alias_map:
-                collision_key = self._unit_alias_map[normalized_key]
-                logger.warning(
-                    f"Alias collision: '{normalized_key}' already mapped to '{collision_key}', "
-                    f"now also found in temperature unit '{canonical_key}'. "
-                    f"Using first occurrence."
-                )
-            else:
-                self._unit_alias_map[normalized_key] = canonical_key
-
-            for alias in temp_unit_detail.aliases:
-                normalized_alias = alias.lower().strip()
-                if normalized_alias in self._unit_alias_map:
-                    collision_key = self._unit_alias_map[normalized_alias]
+        self._alias_map = alias_map
+
+        # Cached once; a tuple so callers cannot mutate the shared index
+        self._all_ingredient_names = tuple(self._alias_map)
+
+        # Bucket names by length to prune fuzzy-match candidates
+        self._names_by_len = {}
+        for name in self._all_ingredient_names:
+            self._names_by_len.setdefault(len(name), []).append(name)
+
+    def _iter_units(self) -> Iterator[Tuple[str, str, UnitDetail | TemperatureUnitDetail]]:
+        """Yield (category, canonical_key, detail) for every unit, in priority order."""
+        yield from (("volume", k, d) for k, d in self.units_db.volume.units.items())
+        yield from (("weight", k, d) for k, d in self.units_db.weight.units.items())
+        yield from (("temperature", k, d) for k, d in self.units_db.temperature.units.items())
+
+    def _build_unit_alias_map(self) -> None:
+        """Build a master lookup index mapping every unit alias to its AliasInfo."""
+        alias_map: Dict[str, str] = {}
+        type_map: Dict[str, str] = {}
+        factor_map: Dict[str, float] = {}
+
+        for category, canonical_key, unit_detail in self._iter_units():
+            type_map.setdefault(canonical_key, category)
+            if isinstance(unit_detail, UnitDetail):
+                factor_map.setdefault(canonical_key, unit_detail.factor)
+
+            # Canonical key first, then its aliases (deduplicated, order kept)
+            names: Dict[str, None] = dict.fromkeys(
+                [canonical_key.lower().strip()] + [alias.lower().strip() for alias in unit_detail.aliases]
+            )
+            for name in names:
+                existing: str | None = alias_map.get(name)
+                if existing is None:
+                    alias_map[sys.intern(name)] = sys.intern(canonical_key)
+                elif existing != canonical_key:
                     logger.warning(
-                        f"Alias collision: '{normalized_alias}' already mapped to '{collision_key}', "
-                        f"now also found in temperature unit '{canonical_key}'. "
-                        f"Using first occurrence."
+                        "Alias collision: '%s' already mapped to '%s', now also found in %s unit '%s'. "
+                        "Using first occurrence.",
+                        name, existing, category, canonical_key
                     )
-                else:
-                    self._unit_alias_map[normalized_alias] = canonical_key
+
+        # One hash lookup answers type, canonical key, factor and its reciprocal
+        # (so converting out of base units is a multiply) for any alias
+        alias_index: Dict[str, AliasInfo] = {}
+        for alias, canonical_key in alias_map.items():
+            factor: float | None = factor_map.get(canonical_key)
+            inv_factor: float | None = None if factor is None else 1.0 / factor
+            alias_index[alias] = AliasInfo(type_map[canonical_key], canonical_key, factor, inv_factor)
+        self._alias_index = alias_index
 
     def _resolve_unit(self, raw_input: str) -> str:
         """
@@ -135,10 +164,28 @@ class Repository:
         Raises:
             UnitNotFoundError: If the input cannot be resolved to a known unit
         """
-        normalized: str = raw_input.lower().strip()
-        if normalized in self._unit_alias_map:
-            return self._unit_alias_map[normalized]
-        raise UnitNotFoundError(f"Unit '{raw_input}' is not recognized.")
+        return self._unit_entry(raw_input).canonical
+
+    def _unit_entry(self, raw_input: str) -> AliasInfo:
+        # Fast path: input is already a normalized alias (the common case)
+        entry = self._alias_index.get(raw_input)
+        if entry is None:
+            entry = self._alias_index.get(raw_input.lower().strip())
+            if entry is None:
+                raise UnitNotFoundError(f"Unit '{raw_input}' is not recognized.")
+        return entry
+
+    def get_canonical_unit(self, unit_name: str) -> str:
+        """
+        Returns the canonical key for a unit name or alias.
+
+        Args:
+            unit_name: User-provided unit name (supports aliases)
+
+        Returns:
+            Canonical unit key (e.g., "fahrenheit" -> "f")
+        """
+        return self._resolve_unit(unit_name)
 
     def get_unit_type(self, unit_name: str) -> str:
         """
@@ -150,16 +197,7 @@ class Repository:
         Returns:
             The type of unit: 'volume', 'weight', or 'temperature'
         """
-        canonical_key: str = self._resolve_unit(unit_name)
-
-        if canonical_key in self.units_db.volume.units:
-            return "volume"
-        if canonical_key in self.units_db.weight.units:
-            return "weight"
-        if canonical_key in self.units_db.temperature.units:
-            return "temperature"
-
-        raise UnitNotFoundError(f"Unit '{unit_name}' type could not be determined.")
+        return self._unit_entry(unit_name).unit_type
 
     def get_factor(self, unit_name: str) -> float:
         """
@@ -171,22 +209,72 @@ class Repository:
         Returns:
             The conversion factor to the base unit
         """
-        canonical_key: str = self._resolve_unit(unit_name)
+        factor = self._unit_entry(unit_name).factor
+        if factor is None:
+            # Temperature does not use simple factors
+            raise UnitNotFoundError(f"No linear factor for unit '{unit_name}'.")
+        return factor
+
+    def get_inv_factor(self, unit_name: str) -> float:
+        """
+        Returns the reciprocal of the conversion factor (base unit -> unit).
 
-        if canonical_key in self.units_db.volume.units:
-            return self.units_db.volume.units[canonical_key].factor
-        if canonical_key in self.units_db.weight.units:
-            return self.units_db.weight.units[canonical_key].factor
+        Args:
+            unit_name: User-provided unit name (supports aliases)
 
-        # Temperature does not use simple factors
-        raise UnitNotFoundError(f"No linear factor for unit '{unit_name}'.")
+        Returns:
+            1 / factor, precomputed at load time
+        """
+        inv_factor = self._unit_entry(unit_name).inv_factor
+        if inv_factor is None:
+            # Temperature does not use simple factors
+            raise UnitNotFoundError(f"No linear factor for unit '{unit_name}'.")
+        return inv_factor
 
-    def get_all_ingredient_names(self) -> List[str]:
-        return list(self._alias_map.keys())
+    def get_all_ingredient_names(self) -> Tuple[str, ...]:
+        """Return every lowercased ingredient name and alias, computed once at load."""
+        return self._all_ingredient_names
+
+    def get_candidate_ingredient_names(self, query: str, cutoff: float) -> List[str]:
+        """
+        Return the ingredient names that could reach a difflib ratio of `cutoff`.
+
+        A ratio can never exceed 2 * min(len_a, len_b) / (len_a + len_b), so
+        whole length buckets below the cutoff are skipped without scoring.
+
+        Args:
+            query: Normalized ingredient string
+            cutoff: Minimum similarity ratio in [0, 1]
+
+        Returns:
+            Names from all length buckets within tolerance
+        """
+        query_len: int = len(query)
+        candidates: List[str] = []
+        for name_len, names in self._names_by_len.items():
+            total: int = query_len + name_len
+            if 2.0 * min(query_len, name_len) / total >= cutoff:
+                candidates.extend(names)
+        return candidates
 
     def get_ingredient_by_name(self, name: str) -> IngredientEntry | None:
+        hit: IngredientEntry | None = self._alias_map.get(name)
+        if hit is not None:
+            return hit
         return self._alias_map.get(name.lower())
 
+    def _find_ingredient_names(self, cleaned_input: str) -> Tuple[str, ...]:
+        """
+        Find the alias names matching an already normalized ingredient string.
+
+        Returns a single exact alias if there is one, otherwise up to three fuzzy
+        matches. An empty tuple means nothing matched, so misses are cached too.
+        """
+        if cleaned_input in self._alias_map:
+            return (cleaned_input,)
+        candidates: List[str] = self.get_candidate_ingredient_names(cleaned_input, _FUZZY_CUTOFF)
+        return tuple(difflib.get_close_matches(cleaned_input, candidates, n=3, cutoff=_FUZZY_CUTOFF))
+
     def match_ingredient(self, input_name: str) -> IngredientEntry:
         """
         Match an ingredient name using exact or fuzzy matching.
@@ -204,28 +292,42 @@ class Repository:
         if not input_name:
             raise IngredientNotFoundError("No ingredient specified for density conversion.")
 
-        cleaned_input: str = input_name.lower().strip()
-
-        # 1. Exact Match
-        exact: IngredientEntry | None = self.get_ingredient_by_name(cleaned_input)
+        # Fast path: already-normalized exact alias, no string copies
+        exact: IngredientEntry | None = self._alias_map.get(input_name)
         if exact is not None:
             return exact
 
-        # 2. Fuzzy Match
-        all_names: List[str] = self.get_all_ingredient_names()
-        matches: List[str] = difflib.get_close_matches(cleaned_input, all_names, n=3, cutoff=0.6)
+        cleaned_input: str = input_name.lower().strip()
+
+        # Exact and fuzzy lookup (memoized)
+        matches: Tuple[str, ...] = self._lookup_ingredient_names(cleaned_input)
 
         if not matches:
             raise IngredientNotFoundError(f"Ingredient '{input_name}' not found in database.")
 
-        ingredient_entries: List[IngredientEntry | None] = [self.get_ingredient_by_name(name) for name in matches]
+        # Matches are alias-map keys, so every name resolves to an entry
+        ingredient_entries: List[IngredientEntry] = [self._alias_map[name] for name in matches]
 
         # check if multiple distinct ingredients matched
-        if len(set(ie.id for ie in ingredient_entries if ie is not None)) > 1:
+        if len(set(ie.id for ie in ingredient_entries)) > 1:
             raise IngredientAmbiguousError(
                 f"Ambiguous ingredient '{input_name}'. Close matches: {', '.join(matches)}"
             )
-        ingredient_entry: IngredientEntry | None = ingredient_entries[0]
-        if ingredient_entry is None:
-            raise IngredientNotFoundError(f"Ingredient '{input_name}' not found in database.")
-        return ingredient_entry
+        return ingredient_entries[0]
+
+
+@functools.lru_cache(maxsize=4)
+def get_default_repository(data_path: Optional[Path] = None) -> Repository:
+    """
+    Load a Repository once per process and share it.
+
+    Args:
+        data_path: Directory with units.json and ingredients.json.
+            If None, uses the bundled data.
+
+    Returns:
+        The cached Repository for that directory
+    """
+    if data_path is None:
+        data_path = Path(str(files('recipe_unit_converter') / 'data'))
+    return Repository(data_path)
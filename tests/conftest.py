@@ -0,0 +1,37 @@
+import functools
+import pytest
+from pathlib import Path
+from recipe_unit_converter.repository import Repository
+from recipe_unit_converter.converter import Converter
+
+DATA_PATH = Path(__file__).resolve().parent.parent / "src" / "recipe_unit_converter" / "data"
+
+
+@pytest.fixture(scope="session")
+def repo():
+    """Create a repository with test data, built once per test session."""
+    return Repository(DATA_PATH)
+
+
+@pytest.fixture
+def fresh_repo():
+    """A repository of its own, for tests that inspect per-instance cache state."""
+    return Repository(DATA_PATH)
+
+
+@pytest.fixture(scope="session")
+def converter(repo):
+    """Create a converter instance (read-only, safe to share)."""
+    return Converter(repo)
+
+
+@pytest.fixture(scope="session")
+def converted(converter):
+    """Memoized converter.convert for tests that only read the result."""
+    return functools.lru_cache(maxsize=None)(converter.convert)
+
+
+@pytest.fixture(scope="session")
+def cached_match(repo):
+    """Memoized repo.match_ingredient for tests that only read the entry."""
+    return functools.lru_cache(maxsize=None)(repo.match_ingredient)
@@ -1,100 +1,53 @@
 import pytest
-from pathlib import Path
-from recipe_unit_converter.repository import Repository
-from recipe_unit_converter.converter import Converter
-from recipe_unit_converter.exceptions import InvalidConversionError, ParsingError, IngredientNotFoundError
-
-
-@pytest.fixture
-def repo():
-    """Create a repository with test data."""
-    base_path = Path(__file__).parent.parent / "src" / "recipe_unit_converter" / "data"
-    return Repository(base_path)
-
-
-@pytest.fixture
-def converter(repo):
-    """Create a converter instance."""
-    return Converter(repo)
+from recipe_unit_converter.exceptions import InvalidConversionError, ParsingError, IngredientNotFoundError, UnitNotFoundError
 
 
 class TestTemperatureConversions:
     """Test temperature conversion scenarios."""
 
-    def test_celsius_to_fahrenheit(self, converter):
-        result = converter.convert("100 c", "f")
-        assert result.result_value == 212.0
-        assert result.result_unit == "f"
+    @pytest.mark.parametrize("query,target,expected,tol", [
+        ("100 c", "f", 212.0, 0.0),
+        ("32 f", "c", 0.0, 0.0),
+        ("0 c", "k", 273.15, 0.0),
+        ("273.15 k", "c", 0.0, 0.0),
+        ("32 f", "k", 273.15, 0.01),
+        # Aliases resolve to their canonical units
+        ("212 fahrenheit", "celsius", 100.0, 0.0),
+    ], ids=["c2f", "f2c", "c2k", "k2c", "f2k", "aliases"])
+    def test_temperature(self, converted, query, target, expected, tol):
+        result = converted(query, target)
+        assert result.result_value == pytest.approx(expected, abs=tol)
+        assert result.result_unit == target
         assert "Temperature converted" in result.explanation
 
-    def test_fahrenheit_to_celsius(self, converter):
-        result = converter.convert("32 f", "c")
-        assert result.result_value == 0.0
-        assert result.result_unit == "c"
-
-    def test_celsius_to_kelvin(self, converter):
-        result = converter.convert("0 c", "k")
-        assert result.result_value == 273.15
-        assert result.result_unit == "k"
-
-    def test_kelvin_to_celsius(self, converter):
-        result = converter.convert("273.15 k", "c")
-        assert result.result_value == 0.0
-        assert result.result_unit == "c"
-
-    def test_fahrenheit_to_kelvin(self, converter):
-        result = converter.convert("32 f", "k")
-        assert abs(result.result_value - 273.15) < 0.01
-        assert result.result_unit == "k"
-
-    def test_temperature_to_weight_error(self, converter):
-        """Temperature cannot be converted to weight."""
-        with pytest.raises(InvalidConversionError):
-            converter.convert("100 c", "g")
-
-    def test_weight_to_temperature_error(self, converter):
-        """Weight cannot be converted to temperature."""
-        with pytest.raises(InvalidConversionError):
-            converter.convert("100 g flour", "f")
-
 
 class TestSameCategoryConversions:
     """Test linear conversions within the same category."""
 
-    def test_cups_to_ml(self, converter):
-        """Convert cups to milliliters."""
-        result = converter.convert("1 cup", "ml")
-        # 1 cup = 236.588 ml
-        assert abs(result.result_value - 236.588) < 0.01
-        assert result.result_unit == "ml"
+    @pytest.mark.parametrize("query,target,expected,tol", [
+        ("1 cup", "ml", 236.588, 0.01),       # 1 cup = 236.588 ml
+        ("1 tbsp", "tsp", 3.0, 0.0),          # 1 tbsp = 3 tsp
+        ("1000 g", "kg", 1.0, 0.0),
+        ("16 oz", "lb", 1.0, 0.0),
+        ("1 l", "cup", 1000 / 236.588, 0.01), # 1 L = 1000 ml
+    ], ids=["cup2ml", "tbsp2tsp", "g2kg", "oz2lb", "l2cup"])
+    def test_linear(self, converted, query, target, expected, tol):
+        result = converted(query, target)
+        assert result.result_value == pytest.approx(expected, abs=tol)
+        assert result.result_unit == target
         assert result.ingredient is None
-
-    def test_tbsp_to_tsp(self, converter):
-        """Convert tablespoons to teaspoons."""
-        result = converter.convert("1 tbsp", "tsp")
-        # 1 tbsp = 3 tsp
-        assert result.result_value == 3.0
-        assert result.result_unit == "tsp"
-
-    def test_grams_to_kg(self, converter):
-        """Convert grams to kilograms."""
-        result = converter.convert("1000 g", "kg")
-        assert result.result_value == 1.0
-        assert result.result_unit == "kg"
-
-    def test_oz_to_lb(self, converter):
-        """Convert ounces to pounds."""
-        result = converter.convert("16 oz", "lb")
-        assert result.result_value == 1.0
-        assert result.result_unit == "lb"
-
-    def test_liters_to_cups(self, converter):
-        """Convert liters to cups."""
-        result = converter.convert("1 l", "cup")
-        # 1 L = 1000 ml, 1 cup = 236.588 ml
-        expected = 1000 / 236.588
-        assert abs(result.result_value - expected) < 0.01
-        assert result.result_unit == "cup"
+        # Every field of the result is populated from the query
+        assert result.original_query == query
+        assert result.source_unit == query.split()[1]
+        assert result.target_unit == target
+        assert isinstance(result.explanation, str) and result.explanation
+
+    def test_same_unit_is_noop(self, converter):
+        """Identical source and target units return the quantity unchanged."""
+        result = converter.convert("2.5 cups flour", "CUPS")
+        assert result.result_value == 2.5
+        assert result.ingredient is None
+        assert "identical" in result.explanation
 
 
 class TestCrossCategoryConversions:
@@ -114,7 +67,7 @@ class TestCrossCategoryConversions:
         result = converter.convert("100 ml water", "g")
         # Water density = 0.997 g/ml (actual density in database)
         expected = 100.0 * 0.997
-        assert abs(result.result_value - expected) < 0.1
+        assert result.result_value == pytest.approx(expected, abs=0.1)
         assert result.result_unit == "g"
         assert result.ingredient == "water"
 
@@ -125,25 +78,19 @@ class TestCrossCategoryConversions:
         assert result.result_unit == "cup"
         assert result.ingredient == "sugar"
 
-    def test_cross_category_without_ingredient_error(self, converter):
-        """Cross-category conversion requires ingredient."""
-        with pytest.raises(InvalidConversionError, match="Ingredient must be specified"):
-            converter.convert("100 ml", "g")
-
-    def test_cross_category_unknown_ingredient_error(self, converter):
-        """Unknown ingredient should raise error."""
-        with pytest.raises(IngredientNotFoundError):
-            converter.convert("100 ml unknownfooditem", "g")
-
 
 class TestParsingAndEdgeCases:
     """Test parsing and edge cases."""
 
-    def test_decimal_quantities(self, converter):
-        """Handle decimal quantities."""
-        result = converter.convert("2.5 cup", "ml")
-        expected = 2.5 * 236.588
-        assert abs(result.result_value - expected) < 0.01
+    @pytest.mark.parametrize("query,target,expected,tol", [
+        ("2.5 cup", "ml", 2.5 * 236.588, 0.01),
+        # Units are case insensitive
+        ("1 CUP", "ML", 236.588, 0.01),
+        ("1 cup", "ml", 236.588, 0.01),
+    ], ids=["decimal", "upper_case", "lower_case"])
+    def test_quantity_and_unit_forms(self, converted, query, target, expected, tol):
+        result = converted(query, target)
+        assert result.result_value == pytest.approx(expected, abs=tol)
 
     def test_parse_with_of_keyword(self, converter):
         """Handle 'of' keyword in query."""
@@ -157,55 +104,70 @@ class TestParsingAndEdgeCases:
         result2 = converter.convert("1 cup of water", "g")
         assert result2.ingredient == "water"
 
-    def test_invalid_query_format(self, converter):
-        """Invalid query format should raise ParsingError."""
-        with pytest.raises(ParsingError):
-            converter.convert("invalid query", "g")
-
-    def test_case_insensitive_units(self, converter):
+    def test_case_insensitive_units(self, converted):
         """Units should be case insensitive."""
-        result1 = converter.convert("1 CUP", "ML")
-        result2 = converter.convert("1 cup", "ml")
-        assert abs(result1.result_value - result2.result_value) < 0.01
+        result1 = converted("1 CUP", "ML")
+        result2 = converted("1 cup", "ml")
+        assert result1.result_value == pytest.approx(result2.result_value, abs=0.01)
 
-    def test_result_rounding(self, converter):
+    def test_result_rounding(self, converted):
         """Results should be rounded to 4 decimal places."""
-        result = converter.convert("1 cup", "ml")
+        result = converted("1 cup", "ml")
         # Check that result has at most 4 decimal places
         decimal_places = len(str(result.result_value).split('.')[-1])
         assert decimal_places <= 4
 
 
-class TestConversionResultModel:
-    """Test that conversion results contain expected data."""
-
-    def test_result_contains_original_query(self, converter):
-        query = "2 cups flour"
-        result = converter.convert(query, "g")
-        assert result.original_query == query
-
-    def test_result_contains_units(self, converter):
-        result = converter.convert("1 cup", "ml")
-        assert result.source_unit == "cup"
-        assert result.target_unit == "ml"
+class TestConversionErrors:
+    """Test that invalid conversions raise the specific error."""
 
-    def test_result_contains_explanation(self, converter):
-        result = converter.convert("1 cup", "ml")
-        assert len(result.explanation) > 0
-        assert isinstance(result.explanation, str)
+    @pytest.mark.parametrize("query,target,err,match", [
+        ("100 c", "g", InvalidConversionError, None),
+        ("100 g flour", "f", InvalidConversionError, None),
+        # Unknown units are rejected even when source and target match
+        ("2 bogus", "bogus", UnitNotFoundError, None),
+        ("100 ml", "g", InvalidConversionError, "Ingredient must be specified"),
+        ("100 ml unknownfooditem", "g", IngredientNotFoundError, None),
+        ("invalid query", "g", ParsingError, None),
+    ], ids=["temp2weight", "weight2temp", "same_unknown_unit", "no_ingredient", "unknown_ingredient",
+            "invalid_query"])
+    def test_conversion_error(self, converter, query, target, err, match):
+        with pytest.raises(err, match=match):
+            converter.convert(query, target)
 
 
 class TestEnhancedParsing:
     """Test enhanced parsing features: fractions and word numbers."""
 
-    def test_simple_fraction(self, converter):
+    def test_simple_fraction(self, converted):
         """Parse simple fraction like 1/4."""
-        result = converter.convert("1/4 cup", "ml")
+        result = converted("1/4 cup", "ml")
         expected = 0.25 * 236.588
-        assert abs(result.result_value - expected) < 0.01
+        assert result.result_value == pytest.approx(expected, abs=0.01)
 
-    def test_mixed_fraction(self, converter):
+    def test_mixed_fraction(self, converted):
         """Parse mixed fraction like 1 1/2."""
-        result = converter.convert("1 1/2 cup", "ml")
+        result = converted("1 1/2 cup", "ml")
         expected = 1.5 * 236.588
-        assert abs(result.result_value - expected) < 0.01
+        assert result.result_value == pytest.approx(expected, abs=0.01)
+
+
+class TestBatchConversion:
+    """Test converting several queries at once."""
+
+    def test_batch_matches_single_conversions(self, converter):
+        """Batch results should equal one-by-one conversions, in input order."""
+        queries = ["2 cups flour", "100 g flour", "1 cup water", "3 tbsp", "2 cups flour"]
+        results = converter.convert_batch(queries, "ml")
+        assert [r.original_query for r in results] == queries
+        for query, result in zip(queries, results):
+            assert result == converter.convert(query, "ml")
+
+    def test_batch_empty(self, converter):
+        """An empty batch returns an empty list."""
+        assert converter.convert_batch([], "g") == []
+
+    def test_batch_propagates_errors(self, converter):
+        """A failing query fails the whole batch."""
+        with pytest.raises(InvalidConversionError):
+            converter.convert_batch(["1 cup flour", "100 ml"], "g")
@@ -1,9 +1,10 @@
 import pytest
 import json
+import logging
 from pathlib import Path
 from recipe_unit_converter.repository import Repository
-from recipe_unit_converter.converter import Converter
 from recipe_unit_converter.parser import Parser
+from recipe_unit_converter.cli import main
 from recipe_unit_converter.exceptions import (
     IngredientAmbiguousError,
     IngredientNotFoundError,
@@ -12,9 +13,48 @@ from recipe_unit_converter.exceptions import (
 )
 
 
+# Decoded payloads for in-memory repositories built with Repository.from_dict
+_EMPTY_UNITS = {
+    "volume": {"base": "ml", "units": {}},
+    "weight": {"base": "g", "units": {}},
+    "temperature": {"units": {}}
+}
+_EMPTY_INGREDIENTS = {"ingredients": []}
+# Volume and weight units sharing the alias "c"
+_UNITS_COLLISION_VW = {
+    "volume": {"base": "ml", "units": {"cup": {"factor": 236.588, "aliases": ["c", "cups"]}}},
+    "weight": {"base": "g", "units": {"gram": {"factor": 1.0, "aliases": ["c", "grams"]}}},
+    "temperature": {"units": {}}
+}
+# Volume and temperature units sharing the alias "c"
+_UNITS_COLLISION_TEMP = {
+    "volume": {"base": "ml", "units": {"cup": {"factor": 236.588, "aliases": ["c"]}}},
+    "weight": {"base": "g", "units": {}},
+    "temperature": {"units": {"celsius": {"aliases": ["c", "deg"]}}}
+}
+# Two ingredients claiming the name "sugar" (case differs)
+_INGREDIENTS_COLLISION = {
+    "ingredients": [
+        {"id": "sugar_white", "names": ["sugar"], "density": 0.85},
+        {"id": "sugar_brown", "names": ["Sugar", "brown sugar"], "density": 0.72}
+    ]
+}
+# Database where fuzzy match returns multiple distinct ingredients
+_AMBIGUOUS_INGREDIENTS = {
+    "ingredients": [
+        {"id": "sugar_white", "names": ["sugar", "white sugar"], "density": 0.85},
+        {"id": "sugar_brown", "names": ["sugars", "brown sugar"], "density": 0.72}
+    ]
+}
+
+
 class TestRepositoryEdgeCases:
     """Test repository edge cases for coverage."""
 
+    @pytest.fixture(autouse=True)
+    def _warn_level(self, caplog):
+        caplog.set_level(logging.WARNING)
+
     def test_missing_units_file(self):
         """Test repository with missing units.json."""
         fake_path = Path("/nonexistent/path")
@@ -24,105 +64,43 @@ class TestRepositoryEdgeCases:
     def test_missing_ingredients_file(self, tmp_path):
         """Test repository with missing ingredients.json."""
         # Create units.json but not ingredients.json
-        (tmp_path / "units.json").write_text('{"volume": {"base": "ml", "units": {}}, "weight": {"base": "g", "units": {}}, "temperature": {"units": {}}}')
+        (tmp_path / "units.json").write_text(json.dumps(_EMPTY_UNITS))
 
         with pytest.raises(FileNotFoundError):
             Repository(tmp_path)
 
-    def test_unit_alias_collision_volume_weight(self, tmp_path, caplog):
+    def test_unit_alias_collision_volume_weight(self, caplog):
         """Test warning when volume and weight units have same alias."""
-        units_data = {
-            "volume": {
-                "base": "ml",
-                "units": {
-                    "cup": {
-                        "factor": 236.588,
-                        "aliases": ["c", "cups"]
-                    }
-                }
-            },
-            "weight": {
-                "base": "g",
-                "units": {
-                    "gram": {
-                        "factor": 1.0,
-                        "aliases": ["c", "grams"]
-                    }
-                }
-            },
-            "temperature": {
-                "units": {}
-            }
-        }
-        ingredients_data = {"ingredients": []}
-
-        (tmp_path / "units.json").write_text(json.dumps(units_data))
-        (tmp_path / "ingredients.json").write_text(json.dumps(ingredients_data))
-
-        import logging
-        with caplog.at_level(logging.WARNING):
-            repo = Repository(tmp_path)
-
-        assert any("Alias collision" in record.message for record in caplog.records)
-
-    def test_unit_alias_collision_temperature(self, tmp_path, caplog):
+        Repository.from_dict(_UNITS_COLLISION_VW, _EMPTY_INGREDIENTS)
+
+        assert "Alias collision" in caplog.text
+
+    def test_unit_alias_collision_temperature(self, caplog):
         """Test warning when temperature units have collision."""
-        units_data = {
-            "volume": {
-                "base": "ml",
-                "units": {
-                    "cup": {
-                        "factor": 236.588,
-                        "aliases": ["c"]
-                    }
-                }
-            },
-            "weight": {
-                "base": "g",
-                "units": {}
-            },
-            "temperature": {
-                "units": {
-                    "celsius": {
-                        "aliases": ["c", "deg"]
-                    }
-                }
-            }
-        }
-        ingredients_data = {"ingredients": []}
-
-        (tmp_path / "units.json").write_text(json.dumps(units_data))
-        (tmp_path / "ingredients.json").write_text(json.dumps(ingredients_data))
-
-        import logging
-        with caplog.at_level(logging.WARNING):
-            repo = Repository(tmp_path)
-
-        assert any("Alias collision" in record.message for record in caplog.records)
+        Repository.from_dict(_UNITS_COLLISION_TEMP, _EMPTY_INGREDIENTS)
+
+        assert "Alias collision" in caplog.text
+
+    def test_ingredient_name_collision(self, caplog):
+        """Test warning when two ingredients share a name; the first one wins."""
+        repo = Repository.from_dict(_EMPTY_UNITS, _INGREDIENTS_COLLISION)
+
+        assert "Ingredient name collision" in caplog.text
+        assert repo.get_ingredient_by_name("SUGAR").id == "sugar_white"
 
 
 class TestConverterEdgeCases:
     """Test converter edge cases for coverage."""
 
-    def test_weight_to_volume_conversion(self):
+    def test_weight_to_volume_conversion(self, converter):
         """Test weight to volume conversion."""
-        from pathlib import Path
-        base_path = Path(__file__).parent.parent / "src" / "recipe_unit_converter" / "data"
-        repo = Repository(base_path)
-        converter = Converter(repo)
-
         result = converter.convert("100 g flour", "cup")
         assert result.result_value > 0
         assert result.result_unit == "cup"
         assert result.ingredient == "flour"
 
-    def test_ingredient_no_density_error(self):
+    def test_ingredient_no_density_error(self, converter):
         """Test cross-category conversion with ingredient missing density."""
-        from pathlib import Path
-        base_path = Path(__file__).parent.parent / "src" / "recipe_unit_converter" / "data"
-        repo = Repository(base_path)
-        converter = Converter(repo)
-
         # Try to convert with a made-up ingredient (if it exists, it shouldn't have density)
         # This tests the error path
         try:
@@ -134,6 +112,12 @@ class TestConverterEdgeCases:
             pass
 
 
+    def test_unsupported_temperature_unit(self, converter):
+        """Temperature keys outside c/f/k have no conversion formula."""
+        with pytest.raises(InvalidConversionError, match="Unsupported temperature conversion"):
+            converter._convert_temp(100.0, "rankine", "c")
+
+
 class TestParserEdgeCases:
     """Test parser edge cases for coverage."""
 
@@ -147,56 +131,29 @@ class TestParserEdgeCases:
         with pytest.raises(ParsingError, match="Invalid quantity"):
             Parser._parse_quantity("xyz")
 
+    def test_parse_quantity_is_cached(self):
+        """Repeated quantity strings are served from the cache."""
+        Parser._parse_quantity("2.5")
+        hits = Parser._parse_quantity.cache_info().hits
+        assert Parser._parse_quantity("2.5") == 2.5
+        assert Parser._parse_quantity.cache_info().hits == hits + 1
+
 
 class TestMatcherEdgeCases:
     """Test matcher edge cases for coverage."""
 
-    def test_ambiguous_ingredient(self, tmp_path):
+    @pytest.mark.slow
+    def test_ambiguous_ingredient(self):
         """Test ambiguous ingredient matching with fuzzy search."""
-        # Create a database where fuzzy match returns multiple distinct ingredients
-        units_data = {
-            "volume": {"base": "ml", "units": {}},
-            "weight": {"base": "g", "units": {}},
-            "temperature": {"units": {}}
-        }
-        ingredients_data = {
-            "ingredients": [
-                {
-                    "id": "sugar_white",
-                    "names": ["sugar", "white sugar"],
-                    "density": 0.85
-                },
-                {
-                    "id": "sugar_brown",
-                    "names": ["sugars", "brown sugar"],
-                    "density": 0.72
-                }
-            ]
-        }
-
-        (tmp_path / "units.json").write_text(json.dumps(units_data))
-        (tmp_path / "ingredients.json").write_text(json.dumps(ingredients_data))
-
-        repo = Repository(tmp_path)
+        repo = Repository.from_dict(_EMPTY_UNITS, _AMBIGUOUS_INGREDIENTS)
 
         # Use a typo that fuzzy matches both sugar types
         with pytest.raises(IngredientAmbiguousError, match="Ambiguous ingredient"):
             repo.match_ingredient("suger")
 
-    def test_fuzzy_match_returns_none(self, tmp_path):
-        """Test when fuzzy match finds a name but ingredient entry is None."""
-        units_data = {
-            "volume": {"base": "ml", "units": {}},
-            "weight": {"base": "g", "units": {}},
-            "temperature": {"units": {}}
-        }
-        # Empty ingredients list
-        ingredients_data = {"ingredients": []}
-
-        (tmp_path / "units.json").write_text(json.dumps(units_data))
-        (tmp_path / "ingredients.json").write_text(json.dumps(ingredients_data))
-
-        repo = Repository(tmp_path)
+    def test_fuzzy_match_returns_none(self):
+        """Test when fuzzy match finds no ingredient at all."""
+        repo = Repository.from_dict(_EMPTY_UNITS, _EMPTY_INGREDIENTS)
 
         with pytest.raises(IngredientNotFoundError):
             repo.match_ingredient("anything")
@@ -207,19 +164,12 @@ class TestCLIEdgeCases:
 
     def test_main_unexpected_error(self, monkeypatch, capsys):
         """Test CLI with unexpected error (non-ConverterError exception)."""
-        import sys
-        from recipe_unit_converter.cli import main
-
         # Mock to raise an unexpected exception
         def mock_converter_init(*args, **kwargs):
             raise RuntimeError("Unexpected error")
 
-        monkeypatch.setattr(sys, 'argv', ['recipe-convert', '1 cup', '--to', 'ml'])
         monkeypatch.setattr('recipe_unit_converter.cli.Converter', mock_converter_init)
 
-        with pytest.raises(SystemExit) as exc_info:
-            main()
-
-        assert exc_info.value.code == 1
+        assert main(['1 cup', '--to', 'ml']) == 1
         captured = capsys.readouterr()
         assert "Unexpected error:" in captured.err
@@ -1,34 +1,25 @@
 import pytest
-from pathlib import Path
-from recipe_unit_converter.repository import Repository
 from recipe_unit_converter.exceptions import IngredientNotFoundError, IngredientAmbiguousError
 
 
-@pytest.fixture
-def repo():
-    """Create a repository with test data."""
-    base_path = Path(__file__).parent.parent / "src" / "recipe_unit_converter" / "data"
-    return Repository(base_path)
-
-
 class TestExactMatching:
     """Test exact ingredient matching."""
 
-    def test_exact_match(self, repo):
+    def test_exact_match(self, cached_match):
         """Should match ingredient exactly."""
-        result = repo.match_ingredient("water")
+        result = cached_match("water")
         assert result is not None
         assert "water" in result.names
 
-    def test_case_insensitive(self, repo):
+    def test_case_insensitive(self, cached_match):
         """Matching should be case-insensitive."""
-        result1 = repo.match_ingredient("water")
-        result2 = repo.match_ingredient("WATER")
+        result1 = cached_match("water")
+        result2 = cached_match("WATER")
         assert result1.id == result2.id
 
-    def test_whitespace_handling(self, repo):
+    def test_whitespace_handling(self, cached_match):
         """Should handle extra whitespace."""
-        result = repo.match_ingredient("  water  ")
+        result = cached_match("  water  ")
         assert result is not None
         assert "water" in result.names
 
@@ -36,28 +27,29 @@ class TestExactMatching:
 class TestFuzzyMatching:
     """Test fuzzy ingredient matching."""
 
-    def test_close_match(self, repo):
-        """Should fuzzy match close ingredient names."""
-        # This assumes "flour" exists in database
-        # and "flou" is close enough
+    @pytest.mark.slow
+    @pytest.mark.parametrize("query,expected_name", [
+        ("flou", "flour"),
+        ("flowr", "flour"),
+        ("suger", "sugar"),
+        ("watr", "water"),
+        ("mlik", "milk"),
+    ])
+    def test_fuzzy(self, cached_match, query, expected_name):
+        """Should fuzzy match close ingredient names and common typos."""
         try:
-            result = repo.match_ingredient("flou")
-            assert "flour" in result.names or result is not None
+            result = cached_match(query)
         except IngredientNotFoundError:
-            # If fuzzy matching doesn't work at this cutoff, that's okay
-            pass
+            pytest.skip(f"fuzzy cutoff too strict for {query!r}")
+        assert expected_name in result.names
 
-    def test_typo_matching(self, repo):
-        """Should match common typos."""
-        # This test depends on actual data
-        # If "flour" is in database, "flowr" might match
-        try:
-            result = repo.match_ingredient("flowr")
-            # If it matches, great
-            assert result is not None
-        except IngredientNotFoundError:
-            # If cutoff is too strict, this is expected
-            pass
+    def test_repeated_lookup_is_cached(self, fresh_repo):
+        """Repeated lookups of the same string should reuse the cached result."""
+        first = fresh_repo.match_ingredient("  FLOUR ")
+        second = fresh_repo.match_ingredient("  FLOUR ")
+        assert first is second is fresh_repo.match_ingredient("flour")
+        info = fresh_repo._lookup_ingredient_names.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
 
 
 class TestErrorHandling:
@@ -78,20 +70,26 @@ class TestErrorHandling:
         with pytest.raises(IngredientNotFoundError, match="notfound123"):
             repo.match_ingredient("notfound123")
 
+    @pytest.mark.parametrize("query", ["water chestnuts", "sugar substitute", "water chestnuts, drained"])
+    def test_known_name_prefix_is_not_a_match(self, repo, query):
+        """An unknown ingredient that merely starts with a known name is not found."""
+        with pytest.raises(IngredientNotFoundError):
+            repo.match_ingredient(query)
+
 
 class TestDensityRetrieval:
     """Test that matched ingredients have density data."""
 
-    def test_water_has_density(self, repo):
+    def test_water_has_density(self, cached_match):
         """Water should have density data."""
-        result = repo.match_ingredient("water")
+        result = cached_match("water")
         assert result.density is not None
         # Water density should be close to 1.0 g/ml
         assert 0.9 < result.density < 1.1
 
-    def test_flour_has_density(self, repo):
+    def test_flour_has_density(self, cached_match):
         """Flour should have density data."""
-        result = repo.match_ingredient("flour")
+        result = cached_match("flour")
         assert result.density is not None
         # Flour density should be reasonable (less than water)
         assert 0.4 < result.density < 0.8
@@ -6,6 +6,9 @@ from recipe_unit_converter.models import (
     IngredientEntry,
     UnitsDb,
     UnitDetail,
+    VolumeDefinition,
+    WeightDefinition,
+    TempDefinition,
 )
 
 
@@ -33,7 +36,7 @@ class TestParsedQuery:
 
     def test_parsed_query_missing_required_field(self):
         """Missing required field should raise error."""
-        with pytest.raises(ValidationError):
+        with pytest.raises(TypeError):
             ParsedQuery(unit="cup", ingredient="flour")  # Missing quantity
 
 
@@ -69,13 +72,27 @@ class TestConversionResult:
 
     def test_conversion_result_missing_field(self):
         """Missing required field should raise error."""
-        with pytest.raises(ValidationError):
+        with pytest.raises(TypeError):
             ConversionResult(
                 original_query="2 cups",
                 source_unit="cup",
                 # Missing target_unit and other required fields
             )
 
+    def test_result_is_immutable(self):
+        """Results are frozen so they can be shared and cached safely."""
+        result = ConversionResult(
+            original_query="1 cup",
+            source_unit="cup",
+            target_unit="ml",
+            result_value=236.588,
+            result_unit="ml",
+            ingredient=None,
+            explanation="Direct conversion"
+        )
+        with pytest.raises(AttributeError):
+            result.result_value = 1.0
+
 
 class TestIngredientEntry:
     """Test IngredientEntry model."""
@@ -122,14 +139,18 @@ class TestUnitDetail:
         with pytest.raises(ValidationError):
             UnitDetail(factor="not a number", aliases=["cup"])
 
+    def test_unit_detail_is_frozen(self):
+        """Loaded unit data is shared by every lookup and cannot be reassigned."""
+        unit = UnitDetail(factor=1.0, aliases=["ml"])
+        with pytest.raises(ValidationError):
+            unit.factor = 2.0
+
 
 class TestUnitsDb:
     """Test UnitsDb model structure."""
 
     def test_units_db_structure(self):
         """UnitsDb should have required structure."""
-        from recipe_unit_converter.models import VolumeDefinition, WeightDefinition, TempDefinition
-
         db = UnitsDb(
             volume=VolumeDefinition(
                 base="ml",
@@ -6,66 +6,37 @@ from recipe_unit_converter.exceptions import ParsingError
 class TestNumericParsing:
     """Test numeric quantity parsing."""
 
-    def test_integer(self):
-        result = Parser.parse("2 cups")
-        assert result.quantity == 2.0
-        assert result.unit == "cups"
-
-    def test_decimal(self):
-        result = Parser.parse("1.5 cups")
-        assert result.quantity == 1.5
-        assert result.unit == "cups"
-
-    def test_simple_fraction(self):
-        result = Parser.parse("1/4 tsp")
-        assert result.quantity == 0.25
-        assert result.unit == "tsp"
-
-    def test_mixed_fraction(self):
-        result = Parser.parse("1 1/2 cups")
-        assert result.quantity == 1.5
-        assert result.unit == "cups"
-
-    def test_complex_mixed_fraction(self):
-        result = Parser.parse("2 3/4 tbsp")
-        assert result.quantity == 2.75
-        assert result.unit == "tbsp"
+    @pytest.mark.parametrize("query,quantity,unit", [
+        ("2 cups", 2.0, "cups"),
+        ("1.5 cups", 1.5, "cups"),
+        ("1/4 tsp", 0.25, "tsp"),
+        ("1 1/2 cups", 1.5, "cups"),
+        ("2 3/4 tbsp", 2.75, "tbsp"),
+    ], ids=["integer", "decimal", "simple_fraction", "mixed_fraction", "complex_mixed_fraction"])
+    def test_numeric(self, query, quantity, unit):
+        result = Parser.parse(query)
+        assert result.quantity == quantity
+        assert result.unit == unit
 
 
 class TestWordNumberParsing:
     """Test word number parsing."""
 
-    def test_word_number_one(self):
-        result = Parser.parse("one cup")
-        assert result.quantity == 1.0
-        assert result.unit == "cup"
-
-    def test_word_number_three(self):
-        result = Parser.parse("three tablespoons")
-        assert result.quantity == 3.0
-        assert result.unit == "tablespoons"
-
-    def test_word_quarter(self):
-        result = Parser.parse("quarter tsp")
-        assert result.quantity == 0.25
-        assert result.unit == "tsp"
-
-    def test_word_half(self):
-        result = Parser.parse("half cup")
-        assert result.quantity == 0.5
-        assert result.unit == "cup"
-
-    def test_half_a(self):
+    @pytest.mark.parametrize("query,quantity,unit,ingredient", [
+        ("one cup", 1.0, "cup", None),
+        ("three tablespoons", 3.0, "tablespoons", None),
+        ("quarter tsp", 0.25, "tsp", None),
+        ("half cup", 0.5, "cup", None),
         # "half a" is treated as quantity, "a" becomes unit, "cup" becomes ingredient
-        result = Parser.parse("half a cup sugar")
-        assert result.quantity == 0.5
-        assert result.unit == "a"
-        assert result.ingredient == "cup sugar"
-
-    def test_word_twenty(self):
-        result = Parser.parse("twenty ml")
-        assert result.quantity == 20.0
-        assert result.unit == "ml"
+        ("half a cup sugar", 0.5, "a", "cup sugar"),
+        ("twenty ml", 20.0, "ml", None),
+        ("a cup of flour", 1.0, "cup", "flour"),
+    ], ids=["one", "three", "quarter", "half", "half_a", "twenty", "article_as_one"])
+    def test_word_number(self, query, quantity, unit, ingredient):
+        result = Parser.parse(query)
+        assert result.quantity == quantity
+        assert result.unit == unit
+        assert result.ingredient == ingredient
 
 
 class TestIngredientParsing:
@@ -91,9 +62,10 @@ class TestIngredientParsing:
 class TestEdgeCases:
     """Test edge cases and error handling."""
 
-    def test_invalid_fraction_zero_denominator(self):
-        with pytest.raises(ParsingError):
-            Parser.parse("1/0 cup")
+    @pytest.mark.parametrize("query", ["1/0 cup", "2 3/0 cup"], ids=["simple", "mixed"])
+    def test_invalid_fraction_zero_denominator(self, query):
+        with pytest.raises(ParsingError, match="denominator is zero"):
+            Parser.parse(query)
 
     def test_empty_query(self):
         with pytest.raises(ParsingError):
@@ -121,3 +93,47 @@ class TestEdgeCases:
         assert result.quantity == 2.0
         assert result.unit == "cups"
         assert result.ingredient == "flour"
+
+    def test_parse_is_memoized(self):
+        """Queries differing only in surrounding whitespace share one cached result."""
+        first = Parser.parse("3 tbsp Brown Sugar")
+        assert Parser.parse("  3 tbsp Brown Sugar ") is first
+        assert first.ingredient == "Brown Sugar"
+
+    def test_scanner_matches_pattern(self):
+        """The hand-rolled scanner must split queries exactly like PATTERN."""
+        queries = [
+            "2 cups flour", "1 1/2 cups", "1 cup of water", "1 cup of of milk",
+            "half a cup sugar", "2   cups   flour", "100 °f", "3 fl_oz", "2 3 cups",
+            "1 cup offal", "5 g2", "2\ncups", "2 cups\nflour", "nounit 12",
+        ]
+        for query in queries:
+            match = Parser.PATTERN.match(query)
+            expected = (match.group(1), match.group(2), match.group(3) or "") if match else None
+            assert Parser._scan(query) == expected, query
+
+    def test_simple_fast_path_matches_full_parse(self):
+        """The "<int> <unit> [word]" fast path must agree with the full parser."""
+        queries = ["2 cups", "500 G", "2 cups flour", "1 cup offal", "1 cup of", "2  cups", "2\tcups", "1/2 cup"]
+        for query in queries:
+            fast = Parser._parse_simple(query)
+            if fast is not None:
+                assert fast == Parser._parse_stripped.__wrapped__(query), query
+        assert Parser._parse_simple("2 cups flour") is not None
+        assert Parser._parse_simple("1 cup offal") is None
+
+    def test_quantity_scanner_matches_pattern(self):
+        """The quantity scanner must read numbers exactly like NUMERIC_PATTERN."""
+        quantities = [
+            "2", "1.5", "1/4", "1 1/2", "2 3/4", "10  1/3", "1.", "1.5.3", "3/", "1 /2",
+            "2abc", "1 1/2x", "12 cups", "x1",
+        ]
+        for qty in quantities:
+            match = Parser.NUMERIC_PATTERN.match(qty)
+            if match is None:
+                expected = None
+            elif match.group(3):
+                expected = int(match.group(1) or 0) + int(match.group(2)) / int(match.group(3))
+            else:
+                expected = float(match.group(4))
+            assert Parser._scan_quantity(qty) == expected, qty
@@ -1,16 +1,10 @@
+import json
 import pytest
-from pathlib import Path
-from recipe_unit_converter.repository import Repository
+from recipe_unit_converter.repository import AliasInfo, Repository, get_default_repository
+from recipe_unit_converter.converter import Converter
 from recipe_unit_converter.exceptions import UnitNotFoundError
 
 
-@pytest.fixture
-def repo():
-    """Create a repository with test data."""
-    base_path = Path(__file__).parent.parent / "src" / "recipe_unit_converter" / "data"
-    return Repository(base_path)
-
-
 class TestDataLoading:
     """Test data loading and initialization."""
 
@@ -55,6 +49,13 @@ class TestUnitResolution:
         # "cups" is alias for "cup"
         assert repo.get_unit_type("cups") == "volume"
 
+    def test_alias_index_entries(self, repo):
+        """Each alias maps to its (type, canonical key, factor, inverse factor) in one entry."""
+        factor = repo.get_factor("cup")
+        assert repo._alias_index["cups"] == AliasInfo("volume", "cup", factor, 1.0 / factor)
+        temp = repo._alias_index["fahrenheit"]
+        assert (temp.unit_type, temp.canonical, temp.factor, temp.inv_factor) == ("temperature", "f", None, None)
+
     def test_case_insensitive(self, repo):
         """Unit resolution should be case-insensitive."""
         assert repo.get_unit_type("CUP") == "volume"
@@ -65,21 +66,29 @@ class TestUnitResolution:
         with pytest.raises(UnitNotFoundError):
             repo.get_unit_type("unknownunit")
 
+    def test_unknown_unit_error_repeated(self, repo):
+        """Failed lookups must not be cached as successes."""
+        for _ in range(2):
+            with pytest.raises(UnitNotFoundError):
+                repo.get_factor("unknownunit")
+
 
 class TestFactorRetrieval:
     """Test conversion factor retrieval."""
 
-    def test_get_factor_volume(self, repo):
-        """Should retrieve volume unit factors."""
-        factor = repo.get_factor("cup")
-        assert factor > 0
-        # 1 cup = 236.588 ml
-        assert abs(factor - 236.588) < 0.01
-
-    def test_get_factor_weight(self, repo):
-        """Should retrieve weight unit factors."""
-        factor = repo.get_factor("kg")
-        assert factor == 1000.0  # 1 kg = 1000 g
+    @pytest.mark.parametrize("unit,factor", [
+        ("cup", 236.588),  # 1 cup = 236.588 ml
+        ("kg", 1000.0),    # 1 kg = 1000 g
+    ], ids=["volume", "weight"])
+    def test_get_factor(self, repo, unit, factor):
+        """Should retrieve unit factors relative to the base unit."""
+        assert repo.get_factor(unit) == pytest.approx(factor, abs=0.01)
+
+    def test_get_inv_factor(self, repo):
+        """Inverse factors should be the precomputed reciprocal."""
+        assert repo.get_inv_factor("cups") == 1.0 / repo.get_factor("cup")
+        with pytest.raises(UnitNotFoundError):
+            repo.get_inv_factor("f")
 
     def test_get_factor_temperature_error(self, repo):
         """Temperature units should not have linear factors."""
@@ -112,3 +121,33 @@ class TestIngredientLookup:
         names = repo.get_all_ingredient_names()
         assert len(names) > 0
         assert all(isinstance(name, str) for name in names)
+        assert names is repo.get_all_ingredient_names()
+
+    def test_candidate_names_prune_by_length(self, repo):
+        """Candidate names should exclude lengths that cannot reach the cutoff."""
+        candidates = repo.get_candidate_ingredient_names("flour", 0.6)
+        assert "flour" in candidates
+        assert all(2.0 * min(5, len(n)) / (5 + len(n)) >= 0.6 for n in candidates)
+        assert len(candidates) < len(repo.get_all_ingredient_names())
+
+
+class TestDefaultRepository:
+    """Test the shared bundled-data repository."""
+
+    def test_default_repository_is_cached(self):
+        """The bundled data should only be loaded once per process."""
+        assert get_default_repository() is get_default_repository()
+        assert Converter().repo is get_default_repository()
+
+
+class TestFromDict:
+    """Test building a repository from in-memory data."""
+
+    def test_from_dict_matches_file_backed(self, repo):
+        """Decoded data should produce the same lookups as the JSON files."""
+        units = json.loads((repo.data_dir / "units.json").read_text())
+        ingredients = json.loads((repo.data_dir / "ingredients.json").read_text())
+        mem_repo = Repository.from_dict(units, ingredients)
+        assert mem_repo.data_dir is None
+        assert mem_repo.get_factor("cups") == repo.get_factor("cups")
+        assert mem_repo.match_ingredient("flour") == repo.match_ingredient("flour")